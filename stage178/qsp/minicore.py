@@ -15,18 +15,26 @@ This file is intentionally *test-compatible* with two call styles found in this
     c.accept_frame({"type":"HANDSHAKE_DONE","session_id":777,"epoch":1,"payload":b""}) -> MiniResult(...)
     c.accept_frame({"type":"REKEY",...}) -> MiniResult(...)
     c.accept_frame({"type":"APP_DATA",...}) -> MiniResult(...)
+    c.accept_batch([{..}, {..}]) -> [MiniResult(...), ...]
 
 Stage178-B addition (minimal):
 - downgrade detection via "mode" pinning:
   handshake pins session.mode; subsequent frames must not change it.
   If changed -> fail-closed "downgrade detected".
+
+High-volume callers may hand dict-style results back with release_result(r)
+once done with them; the next accept_frame() reuses the instance.
 """
 
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass
-from typing import Optional, Any, Dict
+import struct
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, Any, Dict, Iterable, List
 
 
 class ProtocolViolation(Exception):
@@ -34,11 +42,78 @@ class ProtocolViolation(Exception):
     pass
 
 
+# close() reason templates. The leading text is the stable part callers match on.
+_FMT: Dict[str, str] = {
+    "invalid_input": "Invalid frame input",
+    "missing_type": "Missing frame type",
+    "invalid_ids": "Invalid session_id or epoch",
+    "invalid_claimed_ids": "Invalid claimed_session_id or claimed_epoch",
+    "invalid_payload": "Invalid payload",
+    "invalid_mode": "Invalid mode",
+    "unknown_frame": "unknown frame",
+    "before_handshake": "before handshake",
+    "duplicate_handshake": "Duplicate handshake",
+    "handshake_epoch": "Handshake epoch must be >= 1",
+    "bad_epoch": "bad epoch",
+    "session_mismatch": "session mismatch (local={} got={})",
+    "bad_rekey_epoch": "bad rekey epoch (local={} got={})",
+    "epoch_mismatch": "epoch mismatch (local={} got={})",
+    "downgrade": "downgrade detected",
+}
+
+
+# Fresh sha256 state; .copy() is cheaper than constructing a new hasher per call.
+_SHA256_PROTO = hashlib.sha256()
+
+
 def _h(data: bytes) -> bytes:
-    return hashlib.sha256(data).digest()
+    h = _SHA256_PROTO.copy()
+    h.update(data)
+    return h.digest()
+
+
+# Bound pack methods of precompiled structs (no per-call format parsing):
+# - _PACK_HS: b"hs" || session_id (u64 BE) || epoch (i64 BE)
+# - _PACK_Q : epoch (i64 BE), same bytes as epoch.to_bytes(8, "big", signed=True)
+_PACK_HS = struct.Struct(">2sQq").pack
+_PACK_Q = struct.Struct(">q").pack
+
+
+@lru_cache(maxsize=8)
+def _mode_bytes(mode: str) -> bytes:
+    return mode.encode("utf-8")
+
+
+class FrameType(IntEnum):
+    """Interned frame type; the value indexes the per-style handler tables."""
+    HANDSHAKE = 0
+    REKEY = 1
+    APP_DATA = 2
+
+
+# wire name -> FrameType (one dict lookup per frame instead of an if-ladder)
+_DICT_FT: Dict[str, FrameType] = {
+    "HANDSHAKE_DONE": FrameType.HANDSHAKE,
+    "REKEY": FrameType.REKEY,
+    "APP_DATA": FrameType.APP_DATA,
+}
+_OLD_FT: Dict[str, FrameType] = {
+    "HS": FrameType.HANDSHAKE,
+    "REKEY": FrameType.REKEY,
+    "APP_DATA": FrameType.APP_DATA,
+}
+
+# Old-style responses
+_OK_HS = b"OK:HS"
+_OK_REKEY = b"OK:REKEY"
+_OK_APP_DATA_PREFIX = b"OK:APP_DATA:"
 
+# Fully-formed dict frames are unpacked in one C call; frames missing a key
+# (e.g. "frame_type" alias, omitted payload) fall back to per-key .get().
+_FRAME_FIELDS = itemgetter("type", "session_id", "epoch", "payload")
 
-@dataclass
+
+@dataclass(slots=True)
 class MiniResult:
     ok: bool
     detail: str
@@ -47,7 +122,42 @@ class MiniResult:
     key_fingerprint_hex: str
 
 
-@dataclass
+# Optional MiniResult free-list for high-volume callers.
+# accept_frame() draws dict-style results from it; a caller that is done with a
+# result may hand it back via release_result(). Callers that never release
+# simply allocate as before.
+_RESULT_POOL_MAX = 64
+_result_pool: List[MiniResult] = []
+
+
+def _new_result(ok: bool, detail: str, epoch: int, session_id: int, key_fingerprint_hex: str) -> MiniResult:
+    try:
+        r = _result_pool.pop()
+    except IndexError:
+        return MiniResult(ok, detail, epoch, session_id, key_fingerprint_hex)
+    r.ok = ok
+    r.detail = detail
+    r.epoch = epoch
+    r.session_id = session_id
+    r.key_fingerprint_hex = key_fingerprint_hex
+    return r
+
+
+def release_result(r: MiniResult) -> None:
+    """Return a result to the free-list. The caller must not use r afterwards."""
+    # releasing twice must not pool r twice (two later results would alias);
+    # identity scan, since == compares fields. The pool is small.
+    for pooled in _result_pool:
+        if pooled is r:
+            return
+    if len(_result_pool) < _RESULT_POOL_MAX:
+        r.ok = False
+        r.detail = ""
+        r.key_fingerprint_hex = ""
+        _result_pool.append(r)
+
+
+@dataclass(slots=True)
 class MiniSession:
     expected_session_id: Optional[int] = None
 
@@ -59,13 +169,45 @@ class MiniSession:
 
     # Stage178-B: downgrade detection (pinned at handshake)
     mode: Optional[str] = None  # e.g., "PQC+QKD" or "PQC_ONLY"
+    # UTF-8 encoding of the pinned mode (set via set_mode())
+    _mode_b: bytes = field(default=b"", init=False, repr=False, compare=False)
+
+    # sha256 state that has already absorbed key_material.
+    # Keep in sync via set_key_material(); do not assign key_material directly.
+    _key_hasher: Any = field(default=None, init=False, repr=False, compare=False)
+    # hex fingerprint of key_material; None means "recompute on next read"
+    _fp_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._key_hasher = hashlib.sha256(self.key_material)
+
+    def set_mode(self, mode: str) -> None:
+        self.mode = mode
+        self._mode_b = _mode_bytes(mode)
+
+    def set_key_material(self, key_material: bytes) -> None:
+        self.key_material = key_material
+        self._key_hasher = hashlib.sha256(key_material)
+        self._fp_cache = None
+
+    def next_key_material(self, suffix: bytes) -> bytes:
+        """sha256(key_material + suffix), reusing the absorbed key prefix."""
+        h = self._key_hasher.copy()
+        h.update(suffix)
+        return h.digest()
 
     def fingerprint_hex(self) -> str:
-        return hashlib.sha256(self.key_material).hexdigest()
+        if self._fp_cache is None:
+            self._fp_cache = self._key_hasher.hexdigest()
+        return self._fp_cache
 
-    def close(self, reason: str) -> None:
+    def close(self, code: str, *args: Any) -> None:
+        """
+        Fail-closed with a reason from _FMT.
+        Detail args are only formatted here, so callers never build messages on the success path.
+        """
         self.closed = True
-        raise ProtocolViolation(reason)
+        raise ProtocolViolation(_FMT[code].format(*args) if args else _FMT[code])
 
 
 class MiniCore:
@@ -76,11 +218,12 @@ class MiniCore:
     # --- helper expected by some tests ---
     def advance_epoch(self) -> None:
         """Advance local epoch by 1 (used by epoch-mismatch unit test)."""
-        if not self.s.handshake_complete:
-            self.s.close("before handshake")
-        self.s.epoch += 1
+        s = self.s
+        if not s.handshake_complete:
+            s.close("before_handshake")
+        s.epoch += 1
         # Evolve key material deterministically as epoch changes
-        self.s.key_material = _h(self.s.key_material + b"advance" + self.s.epoch.to_bytes(8, "big", signed=True))
+        s.set_key_material(s.next_key_material(b"advance" + _PACK_Q(s.epoch)))
 
     # --- unified accept_frame supporting both call styles ---
     def accept_frame(
@@ -94,11 +237,28 @@ class MiniCore:
         # Branch by call style:
         # - dict style: accept_frame({..})
         # - old style : accept_frame("HS", ..., claimed_session_id=..., claimed_epoch=...)
+        # A session almost always sticks to one style, so the first call rebinds
+        # self.accept_frame to that style's entry point. The entry points route a
+        # frame of the other style back here, which re-specializes.
+        # Note: the bound method stored on the instance references the instance,
+        # so a MiniCore that has accepted a frame is part of a reference cycle and
+        # is reclaimed by the cyclic GC rather than immediately by refcounting.
         if isinstance(ft_or_frame, dict):
+            self.accept_frame = self._accept_dict_frame
             return self._accept_dict_frame(ft_or_frame)
         if isinstance(ft_or_frame, str):
+            self.accept_frame = self._accept_old_style
             return self._accept_old_style(ft_or_frame, payload, claimed_session_id=claimed_session_id, claimed_epoch=claimed_epoch)
-        self.s.close("Invalid frame input")
+        self.s.close("invalid_input")
+
+    def accept_batch(self, frames: Iterable[Dict[str, Any]]) -> List[MiniResult]:
+        """
+        Accept dict-style frames in order (e.g. a drained receive queue).
+        Fail-closed: the first violation closes the session and raises;
+        later frames in the batch are not processed.
+        """
+        accept = self._accept_dict_frame
+        return [accept(f) for f in frames]
 
     # -------------------------
     # downgrade guard (dict)
@@ -112,77 +272,111 @@ class MiniCore:
         mode = frame.get("mode")
         if mode is None:
             return
-        if not isinstance(mode, str):
-            self.s.close("Invalid mode")
+        if type(mode) is not str:
+            self.s.close("invalid_mode")
         if self.s.mode is None:
             # Only pinned at handshake
             return
         if mode != self.s.mode:
-            self.s.close("downgrade detected")
+            self.s.close("downgrade")
 
     # -------------------------
     # dict style implementation
     # -------------------------
-    def _accept_dict_frame(self, frame: Dict[str, Any]) -> MiniResult:
-        ft = frame.get("type") or frame.get("frame_type")
-        if not isinstance(ft, str):
-            self.s.close("Missing frame type")
-
-        sid = frame.get("session_id")
-        epoch = frame.get("epoch")
-        payload_b = frame.get("payload", b"")
-        if payload_b is None:
-            payload_b = b""
-        if isinstance(payload_b, bytearray):
-            payload_b = bytes(payload_b)
-
-        if not isinstance(sid, int) or not isinstance(epoch, int):
-            self.s.close("Invalid session_id or epoch")
-        if not isinstance(payload_b, (bytes, bytearray)):
-            self.s.close("Invalid payload")
-
-        if ft == "HANDSHAKE_DONE":
-            if self.s.handshake_complete:
-                self.s.close("Duplicate handshake")
-            if epoch < 1:
-                self.s.close("Handshake epoch must be >= 1")
-            if self.s.expected_session_id is not None and sid != self.s.expected_session_id:
-                self.s.close("session mismatch")
-
-            # Stage178-B: pin mode at handshake if provided, else default
-            mode = frame.get("mode", "PQC+QKD")
-            if not isinstance(mode, str):
-                self.s.close("Invalid mode")
-            self.s.mode = mode
-
-            self.s.session_id = sid
-            self.s.epoch = epoch
-            self.s.handshake_complete = True
-            self.s.key_material = _h(b"hs" + sid.to_bytes(8, "big") + epoch.to_bytes(8, "big", signed=True) + mode.encode("utf-8"))
-            return MiniResult(True, "handshake", self.s.epoch, self.s.session_id, self.s.fingerprint_hex())
-
-        if not self.s.handshake_complete:
-            self.s.close("before handshake")
+    def _accept_dict_frame(
+        self,
+        frame: Dict[str, Any],
+        payload: Any = None,
+        *,
+        claimed_session_id: int = None,
+        claimed_epoch: int = None,
+    ) -> MiniResult:
+        if not isinstance(frame, dict):
+            # call style changed after specialization (same test as accept_frame,
+            # so subclasses such as OrderedDict stay on this path)
+            return MiniCore.accept_frame(self, frame, payload, claimed_session_id=claimed_session_id, claimed_epoch=claimed_epoch)
+        # itemgetter fast path for plain dicts only: on a subclass, [] may go
+        # through __missing__ (defaultdict would invent and store missing fields)
+        try:
+            if type(frame) is not dict:
+                raise KeyError
+            ft, sid, epoch, payload_b = _FRAME_FIELDS(frame)
+        except KeyError:
+            ft = frame.get("type")
+            sid = frame.get("session_id")
+            epoch = frame.get("epoch")
+            payload_b = frame.get("payload")
+        if not ft:
+            ft = frame.get("frame_type")
+        if type(ft) is not str:
+            self.s.close("missing_type")
+
+        # validate once at entry; exact type checks (bool / int subclasses are rejected)
+        if type(sid) is not int or type(epoch) is not int:
+            self.s.close("invalid_ids")
+
+        t = type(payload_b)
+        if t is not bytes:
+            if payload_b is None:
+                payload_b = b""
+            elif t is bytearray:
+                payload_b = bytes(payload_b)
+            else:
+                self.s.close("invalid_payload")
+
+        code = _DICT_FT.get(ft)
+        if code is None:
+            self.s.close("unknown_frame")
+        return _DICT_HANDLERS[code](self, frame, sid, epoch, payload_b)
+
+    def _gate_dict(self, frame: Dict[str, Any], sid: int) -> None:
+        """Post-handshake gating shared by REKEY / APP_DATA (dict style)."""
+        s = self.s
+        if not s.handshake_complete:
+            s.close("before_handshake")
 
         # Stage178-B: downgrade guard (only after handshake)
         self._guard_mode_dict(frame)
 
-        if sid != self.s.session_id:
-            self.s.close("session mismatch")
-
-        if ft == "REKEY":
-            if epoch != self.s.epoch + 1:
-                self.s.close("bad rekey epoch")
-            self.s.epoch = epoch
-            self.s.key_material = _h(self.s.key_material + b"rekey" + epoch.to_bytes(8, "big", signed=True) + bytes(payload_b))
-            return MiniResult(True, "rekey", self.s.epoch, self.s.session_id, self.s.fingerprint_hex())
+        if sid != s.session_id:
+            s.close("session_mismatch", s.session_id, sid)
 
-        if ft == "APP_DATA":
-            if epoch != self.s.epoch:
-                self.s.close("epoch mismatch")
-            return MiniResult(True, "app", self.s.epoch, self.s.session_id, self.s.fingerprint_hex())
+    def _dict_handshake(self, frame: Dict[str, Any], sid: int, epoch: int, payload_b: bytes) -> MiniResult:
+        s = self.s
+        if s.handshake_complete:
+            s.close("duplicate_handshake")
+        if epoch < 1:
+            s.close("handshake_epoch")
+        if s.expected_session_id is not None and sid != s.expected_session_id:
+            s.close("session_mismatch", s.expected_session_id, sid)
 
-        self.s.close("unknown frame")
+        # Stage178-B: pin mode at handshake if provided, else default
+        mode = frame.get("mode", "PQC+QKD")
+        if not isinstance(mode, str):
+            s.close("invalid_mode")
+        s.set_mode(mode)
+
+        s.session_id = sid
+        s.epoch = epoch
+        s.handshake_complete = True
+        s.set_key_material(_h(_PACK_HS(b"hs", sid, epoch) + s._mode_b))
+        return _new_result(True, "handshake", s.epoch, s.session_id, s.fingerprint_hex())
+
+    def _dict_rekey(self, frame: Dict[str, Any], sid: int, epoch: int, payload_b: bytes) -> MiniResult:
+        s = self.s
+        self._gate_dict(frame, sid)
+        if epoch != s.epoch + 1:
+            s.close("bad_rekey_epoch", s.epoch, epoch)
+        s.epoch = epoch
+        s.set_key_material(s.next_key_material(b"rekey" + _PACK_Q(epoch) + payload_b))
+        return _new_result(True, "rekey", s.epoch, s.session_id, s.fingerprint_hex())
+
+    def _dict_app(self, frame: Dict[str, Any], sid: int, epoch: int, payload_b: bytes) -> MiniResult:
+        s = self.s
+        self._gate_dict(frame, sid)
+        if epoch != s.epoch:
+            s.close("epoch_mismatch", s.epoch, epoch)
+        return _new_result(True, "app", s.epoch, s.session_id, s.fingerprint_hex())
 
     # -------------------------
     # downgrade guard (old style)
@@ -193,76 +387,102 @@ class MiniCore:
         payload starting with b"MODE:" + utf-8 text.
         If pinned mode exists and marker conflicts -> fail-closed.
         This keeps old tests working (they don't use MODE:).
+
+        The marker is compared as raw bytes against the pinned mode's encoding,
+        so a non-matching (or non-UTF-8) marker is reported as a downgrade.
         """
-        if not payload_b.startswith(b"MODE:"):
+        s = self.s
+        # 0x4D == ord("M"): cheap reject before the startswith call
+        if len(payload_b) < 5 or payload_b[0] != 0x4D or not payload_b.startswith(b"MODE:"):
             return
-        try:
-            mode = payload_b[5:].decode("utf-8", errors="strict")
-        except Exception:
-            self.s.close("Invalid mode")
-        if self.s.mode is None:
+        if s.mode is None:
             return
-        if mode != self.s.mode:
-            self.s.close("downgrade detected")
+        if payload_b[5:] != s._mode_b:
+            s.close("downgrade")
 
     # -------------------------
     # old style implementation
     # -------------------------
-    def _accept_old_style(self, ft: str, payload: Any, *, claimed_session_id: int, claimed_epoch: int) -> bytes:
-        if not isinstance(claimed_session_id, int) or not isinstance(claimed_epoch, int):
-            self.s.close("Invalid claimed_session_id or claimed_epoch")
+    def _accept_old_style(
+        self,
+        ft: str,
+        payload: Any = None,
+        *,
+        claimed_session_id: int = None,
+        claimed_epoch: int = None,
+    ) -> bytes:
+        if not isinstance(ft, str):
+            # call style changed after specialization (same test as accept_frame)
+            return MiniCore.accept_frame(self, ft, payload, claimed_session_id=claimed_session_id, claimed_epoch=claimed_epoch)
+        if type(claimed_session_id) is not int or type(claimed_epoch) is not int:
+            self.s.close("invalid_claimed_ids")
 
         # normalize payload
-        if payload is None:
+        t = type(payload)
+        if t is bytes:
+            payload_b = payload
+        elif payload is None:
             payload_b = b""
-        elif isinstance(payload, (bytes, bytearray)):
+        elif t is bytearray:
             payload_b = bytes(payload)
         else:
-            self.s.close("Invalid payload")
-
-        if ft == "HS":
-            if self.s.handshake_complete:
-                self.s.close("Duplicate handshake")
-            if self.s.expected_session_id is not None and claimed_session_id != self.s.expected_session_id:
-                self.s.close("session mismatch")
-
-            # tests use epoch=0 at HS time
-            if claimed_epoch < 0:
-                self.s.close("bad epoch")
-
-            # Stage178-B: pin default mode for old style handshake
-            self.s.mode = "PQC+QKD"
-
-            self.s.session_id = claimed_session_id
-            self.s.epoch = claimed_epoch
-            self.s.handshake_complete = True
-            self.s.key_material = _h(
-                b"hs"
-                + claimed_session_id.to_bytes(8, "big")
-                + claimed_epoch.to_bytes(8, "big", signed=True)
-                + self.s.mode.encode("utf-8")
-            )
-            return b"OK:HS"
-
-        if not self.s.handshake_complete:
-            self.s.close("before handshake")
-
-        # Stage178-B: optional downgrade guard via MODE: marker
-        self._guard_mode_old(payload_b)
+            self.s.close("invalid_payload")
 
-        if claimed_session_id != self.s.session_id:
-            self.s.close("session mismatch")
+        code = _OLD_FT.get(ft)
+        if code is None:
+            self.s.close("unknown_frame")
+        return _OLD_HANDLERS[code](self, payload_b, claimed_session_id, claimed_epoch)
 
-        if ft == "REKEY":
-            if claimed_epoch != self.s.epoch + 1:
-                self.s.close("bad rekey epoch")
-            self.s.epoch = claimed_epoch
-            self.s.key_material = _h(self.s.key_material + b"rekey" + claimed_epoch.to_bytes(8, "big", signed=True) + payload_b)
-            return b"OK:REKEY"
+    def _gate_old(self, payload_b: bytes, claimed_session_id: int) -> None:
+        """Post-handshake gating shared by REKEY / APP_DATA (old style)."""
+        s = self.s
+        if not s.handshake_complete:
+            s.close("before_handshake")
 
-        if ft == "APP_DATA":
-            if claimed_epoch != self.s.epoch:
-                self.s.close("epoch mismatch")
-            return b"OK:APP_DATA:" + bytes(payload_b)
+        # Stage178-B: optional downgrade guard via MODE: marker
+        self._guard_mode_old(payload_b)
 
-        self.s.close("unknown frame")
+        if claimed_session_id != s.session_id:
+            s.close("session_mismatch", s.session_id, claimed_session_id)
+
+    def _old_handshake(self, payload_b: bytes, claimed_session_id: int, claimed_epoch: int) -> bytes:
+        s = self.s
+        if s.handshake_complete:
+            s.close("duplicate_handshake")
+        if s.expected_session_id is not None and claimed_session_id != s.expected_session_id:
+            s.close("session_mismatch", s.expected_session_id, claimed_session_id)
+
+        # tests use epoch=0 at HS time
+        if claimed_epoch < 0:
+            s.close("bad_epoch")
+
+        # Stage178-B: pin default mode for old style handshake
+        s.set_mode("PQC+QKD")
+
+        s.session_id = claimed_session_id
+        s.epoch = claimed_epoch
+        s.handshake_complete = True
+        s.set_key_material(_h(_PACK_HS(b"hs", claimed_session_id, claimed_epoch) + s._mode_b))
+        return _OK_HS
+
+    def _old_rekey(self, payload_b: bytes, claimed_session_id: int, claimed_epoch: int) -> bytes:
+        s = self.s
+        self._gate_old(payload_b, claimed_session_id)
+        if claimed_epoch != s.epoch + 1:
+            s.close("bad_rekey_epoch", s.epoch, claimed_epoch)
+        s.epoch = claimed_epoch
+        s.set_key_material(s.next_key_material(b"rekey" + _PACK_Q(claimed_epoch) + payload_b))
+        return _OK_REKEY
+
+    def _old_app(self, payload_b: bytes, claimed_session_id: int, claimed_epoch: int) -> bytes:
+        s = self.s
+        self._gate_old(payload_b, claimed_session_id)
+        if claimed_epoch != s.epoch:
+            s.close("epoch_mismatch", s.epoch, claimed_epoch)
+        # payload_b is already bytes (normalized at entry); no extra copy
+        return _OK_APP_DATA_PREFIX + payload_b
+
+
+# Handler tables indexed by FrameType (order must match the enum values).
+_DICT_HANDLERS = (MiniCore._dict_handshake, MiniCore._dict_rekey, MiniCore._dict_app)
+_OLD_HANDLERS = (MiniCore._old_handshake, MiniCore._old_rekey, MiniCore._old_app)
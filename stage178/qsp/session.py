@@ -18,6 +18,10 @@ class EpochViolation(Exception):
     """Raised when epoch monotonicity is violated (fail-closed)."""
 
 
+# Formatted only when a violation is raised.
+_MSG = "Epoch rollback/skip rejected (Claim A2): current={e}, attempted={a}, expected={x}"
+
+
 class SessionState:
     def __init__(self) -> None:
         self.epoch: int = 0
@@ -33,11 +37,8 @@ class SessionState:
         - allow only new_epoch == current_epoch + 1
         - otherwise fail-closed
         """
-        expected = self.epoch + 1
-        if new_epoch != expected:
-            raise EpochViolation(
-                f"Epoch rollback/skip rejected (Claim A2): current={self.epoch}, "
-                f"attempted={new_epoch}, expected={expected}"
-            )
+        e = self.epoch
+        if new_epoch != e + 1:
+            raise EpochViolation(_MSG.format(e=e, a=new_epoch, x=e + 1))
         self.epoch = new_epoch
-        return self.epoch
+        return new_epoch
@@ -6,7 +6,7 @@ Make project root importable in pytest.
 
 Why:
 - Some environments run tests with sys.path[0] pointing to tests/ directory,
-  causing 'import qsp.core' to fail.
+  causing 'import qsp.minicore' to fail.
 - Stage178-A requires deterministic CI behavior, so we force-add the repo root.
 """
 
@@ -0,0 +1,28 @@
+# MIT License © 2025 Motohiro Suzuki
+import pytest
+
+from qsp.minicore import MiniCore, ProtocolViolation
+
+
+def test_accept_batch_in_order():
+    c = MiniCore()
+    rs = c.accept_batch([
+        {"type": "HANDSHAKE_DONE", "session_id": 88, "epoch": 1, "payload": b""},
+        {"type": "APP_DATA", "session_id": 88, "epoch": 1, "payload": b"a"},
+        {"type": "REKEY", "session_id": 88, "epoch": 2, "payload": b"k"},
+        {"type": "APP_DATA", "session_id": 88, "epoch": 2, "payload": b"b"},
+    ])
+    assert [r.detail for r in rs] == ["handshake", "app", "rekey", "app"]
+    assert c.s.epoch == 2
+
+
+def test_accept_batch_stops_at_first_violation():
+    c = MiniCore()
+    with pytest.raises(ProtocolViolation):
+        c.accept_batch([
+            {"type": "HANDSHAKE_DONE", "session_id": 89, "epoch": 1, "payload": b""},
+            {"type": "APP_DATA", "session_id": 89, "epoch": 3, "payload": b"a"},
+            {"type": "REKEY", "session_id": 89, "epoch": 2, "payload": b"k"},
+        ])
+    assert c.s.closed is True
+    assert c.s.epoch == 1
@@ -0,0 +1,55 @@
+# MIT License © 2025 Motohiro Suzuki
+import pytest
+
+from qsp.minicore import MiniCore, ProtocolViolation
+
+
+def test_accept_frame_switches_call_style_after_first_frame():
+    c = MiniCore(session_id=55)
+    assert c.accept_frame("HS", claimed_session_id=55, claimed_epoch=0) == b"OK:HS"
+
+    r = c.accept_frame({"type": "APP_DATA", "session_id": 55, "epoch": 0, "payload": b"d"})
+    assert r.detail == "app"
+
+    assert c.accept_frame("APP_DATA", b"z", claimed_session_id=55, claimed_epoch=0) == b"OK:APP_DATA:z"
+
+
+def test_accept_frame_rejects_invalid_input_after_specialization():
+    c = MiniCore()
+    c.accept_frame({"type": "HANDSHAKE_DONE", "session_id": 56, "epoch": 1, "payload": b""})
+
+    with pytest.raises(ProtocolViolation):
+        c.accept_frame(3)
+
+
+def test_accept_frame_accepts_dict_and_str_subclasses():
+    from collections import OrderedDict
+
+    class Ft(str):
+        pass
+
+    c = MiniCore()
+    r = c.accept_frame(OrderedDict(type="HANDSHAKE_DONE", session_id=57, epoch=1, payload=b""))
+    assert r.ok and r.detail == "handshake"
+
+    c = MiniCore(session_id=58)
+    assert c.accept_frame(Ft("HS"), claimed_session_id=58, claimed_epoch=0) == b"OK:HS"
+    # subclass input after specialization stays on the specialized path
+    r = c.accept_frame(OrderedDict(type="APP_DATA", session_id=58, epoch=0, payload=b"d"))
+    assert r.detail == "app"
+    assert c.accept_frame(Ft("APP_DATA"), b"z", claimed_session_id=58, claimed_epoch=0) == b"OK:APP_DATA:z"
+
+
+def test_defaultdict_frame_missing_ids_is_rejected():
+    from collections import defaultdict
+
+    frame = defaultdict(int, type="HANDSHAKE_DONE", payload=b"")
+    with pytest.raises(ProtocolViolation):
+        MiniCore().accept_frame(frame)
+    # missing fields are read with .get(), never materialized in the caller's dict
+    assert "session_id" not in frame and "epoch" not in frame
+
+    frame = defaultdict(int, type="HANDSHAKE_DONE", epoch=1, payload=b"")
+    with pytest.raises(ProtocolViolation):
+        MiniCore().accept_frame(frame)
+    assert "session_id" not in frame
@@ -0,0 +1,22 @@
+# MIT License © 2025 Motohiro Suzuki
+from tools import check_claims_integrity as cci
+
+
+def test_grouped_and_single_paths_agree(tmp_path):
+    (tmp_path / "d").mkdir()
+    (tmp_path / "d" / "a.py").write_text("")
+    (tmp_path / "d" / "b.py").write_text("")
+    (tmp_path / "d" / "sub").mkdir()
+    root = str(tmp_path)
+
+    rels = ["d/a.py", "d/b.py", "d/missing.py", "d/sub", "d/"]
+    grouped = cci._check_files_exist(root, rels, workers=4)
+    for rel in rels:
+        assert grouped[rel] == cci._check_file_exists(root, rel)
+    assert [rel for rel in rels if grouped[rel][0]] == ["d/a.py", "d/b.py"]
+
+
+def test_nul_byte_in_directory_is_reported_missing(tmp_path):
+    res = cci._check_files_exist(str(tmp_path), ["bad\0dir/a.py", "bad\0dir/b.py"], workers=1)
+    assert res["bad\0dir/a.py"][0] is False
+    assert res["bad\0dir/b.py"][0] is False
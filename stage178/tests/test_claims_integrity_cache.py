@@ -0,0 +1,126 @@
+# MIT License © 2025 Motohiro Suzuki
+import json
+import os
+import sys
+
+import pytest
+
+from tools import check_claims_integrity as cci
+
+CLAIMS = """\
+claims:
+- id: A1
+  formal_model: {file: model/m.spthy, lemma: A1_gating}
+  implementation: {file: qsp/impl.py}
+  tests: {positive: [tests/t1.py], negative: [tests/t2.py]}
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    for rel, text in [
+        ("claims/claims.yml", CLAIMS),
+        ("model/m.spthy", "lemma other_lemma: ...\n"),  # A1_gating absent: --strict-lemma fails
+        ("qsp/impl.py", "x = 1\n"),
+        ("tests/t1.py", ""),
+        ("tests/t2.py", ""),
+    ]:
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(text)
+    return tmp_path
+
+
+def _run(monkeypatch, capsys, root, *extra):
+    monkeypatch.setattr(sys, "argv", ["check_claims_integrity.py", "--root", str(root), *extra])
+    rc = cci.main()
+    return rc, capsys.readouterr().out
+
+
+def _touch(path, text):
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_unchanged_rerun_is_served_from_cache(project, monkeypatch, capsys):
+    assert _run(monkeypatch, capsys, project) == (0, "[OK] claims integrity passed: 1 claims checked\n")
+    assert (project / ".cache" / "claims_integrity.json").is_file()
+    assert _run(monkeypatch, capsys, project) == (0, "[OK] claims integrity passed: 1 claims checked (cached)\n")
+
+
+def test_no_cache_flag_forces_full_run(project, monkeypatch, capsys):
+    _run(monkeypatch, capsys, project)
+    rc, out = _run(monkeypatch, capsys, project, "--no-cache")
+    assert rc == 0 and "(cached)" not in out
+
+
+def test_artifact_change_invalidates_cache(project, monkeypatch, capsys):
+    _run(monkeypatch, capsys, project)
+    _touch(project / "qsp" / "impl.py", "x = 22\n")
+    rc, out = _run(monkeypatch, capsys, project)
+    assert rc == 0 and "(cached)" not in out
+    assert "(cached)" in _run(monkeypatch, capsys, project)[1]
+
+
+def test_claims_edit_invalidates_cache(project, monkeypatch, capsys):
+    _run(monkeypatch, capsys, project)
+    _touch(project / "claims" / "claims.yml", CLAIMS.replace("tests/t2.py]", "tests/t2.py, tests/t3.py]"))
+    rc, out = _run(monkeypatch, capsys, project)
+    assert rc == 2
+    assert "tests.negative missing: tests/t3.py" in out
+
+
+def test_strict_lemma_toggle_is_not_served_from_cache(project, monkeypatch, capsys):
+    assert _run(monkeypatch, capsys, project)[0] == 0
+    rc, out = _run(monkeypatch, capsys, project, "--strict-lemma")
+    assert rc == 2
+    assert "lemma name not found in model file text: A1_gating" in out
+
+
+def test_failures_are_never_cached(project, monkeypatch, capsys):
+    (project / "model" / "m.spthy").write_text("")  # still exists; lemma missing
+    first = _run(monkeypatch, capsys, project, "--strict-lemma")
+    assert first[0] == 2
+    assert not (project / ".cache" / "claims_integrity.json").exists()
+    assert _run(monkeypatch, capsys, project, "--strict-lemma") == first
+
+
+@pytest.mark.parametrize("garbage", ["{not json", "[1, 2]", '{"x": "y"}', ""])
+def test_corrupt_cache_file_is_ignored(project, monkeypatch, capsys, garbage):
+    cache = project / ".cache" / "claims_integrity.json"
+    cache.parent.mkdir()
+    cache.write_text(garbage)
+    rc, out = _run(monkeypatch, capsys, project)
+    assert rc == 0 and "(cached)" not in out
+    assert "(cached)" in _run(monkeypatch, capsys, project)[1]
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("files", [1, None]),
+        ("warnings", "abc"),
+        ("warnings", [1]),
+        ("warnings", None),
+        ("claims", "1"),
+        ("claims", None),
+        ("claims", True),
+    ],
+)
+def test_malformed_cache_entry_is_ignored(project, monkeypatch, capsys, field, value):
+    _run(monkeypatch, capsys, project)
+    cache = project / ".cache" / "claims_integrity.json"
+    data = json.loads(cache.read_text())
+    (entry,) = data.values()
+    entry[field] = value
+    cache.write_text(json.dumps(data))
+    assert _run(monkeypatch, capsys, project) == (0, "[OK] claims integrity passed: 1 claims checked\n")
+
+
+def test_deleted_artifact_is_seen_by_next_in_process_run(project, monkeypatch, capsys):
+    assert _run(monkeypatch, capsys, project, "--no-cache")[0] == 0
+    (project / "qsp" / "impl.py").unlink()
+    rc, out = _run(monkeypatch, capsys, project, "--no-cache")
+    assert rc == 2
+    assert "implementation.file not found: qsp/impl.py" in out
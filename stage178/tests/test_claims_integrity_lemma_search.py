@@ -0,0 +1,28 @@
+# MIT License © 2025 Motohiro Suzuki
+import pytest
+
+from tools import check_claims_integrity as cci
+
+
+@pytest.mark.parametrize("use_ahocorasick", [False, True])
+def test_mmap_window_search_matches_plain_search(tmp_path, monkeypatch, use_ahocorasick):
+    if use_ahocorasick and cci.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    if not use_ahocorasick:
+        monkeypatch.setattr(cci, "ahocorasick", None)
+    # force the mmap path with tiny windows so matches straddle window edges
+    monkeypatch.setattr(cci, "_MODEL_READ_MAX_BYTES", 0)
+    monkeypatch.setattr(cci, "_MMAP_WINDOW", 16)
+
+    text = b"x" * 13 + b"lemma_alpha" + b"y" * 20 + b"lemma_beta" + b"z" * 40
+    model = tmp_path / "model.spthy"
+    model.write_bytes(text)
+    lemmas = {"lemma_alpha", "lemma_beta", "lemma_gamma", "y" * 20}
+
+    expected = {l for l in lemmas if l.encode() in text}
+    assert cci._find_lemmas_in_model(str(model), lemmas) == expected
+    assert expected == {"lemma_alpha", "lemma_beta", "y" * 20}
+
+
+def test_unreadable_model_file_has_no_hits(tmp_path):
+    assert cci._find_lemmas_in_model(str(tmp_path / "missing.spthy"), {"lemma_alpha"}) == set()
@@ -0,0 +1,110 @@
+# MIT License © 2025 Motohiro Suzuki
+import pytest
+import yaml
+
+from tools import check_claims_integrity as cci
+
+PLAIN = """\
+schema_version: 1
+project: QSP
+claims:
+- id: A1
+  title: Handshake gating
+  assumptions: [one, two]
+  formal_model: {tool: tamarin, file: model/m.spthy, lemma: A1_gating}
+  implementation: {file: qsp/minicore.py, anchor: x}
+  tests:
+    positive: [tests/t1.py]
+    negative: [tests/t2.py, 5]
+- id: 7
+  formal_model: null
+  tests: {positive: tests/t1.py}
+- just a string
+"""
+
+ANCHORS = """\
+common: &impl {file: qsp/minicore.py}
+claims:
+- id: A1
+  implementation: *impl
+  tests: &t {positive: [tests/t1.py], negative: [tests/t2.py]}
+- id: A2
+  implementation: *impl
+  tests: *t
+"""
+
+MERGE = """\
+base: &base
+  formal_model: {file: model/m.spthy, lemma: L}
+  tests: {negative: [tests/t2.py]}
+claims:
+- <<: *base
+  id: M1
+  implementation: {file: qsp/minicore.py}
+- <<: *base
+  id: M2
+  tests: {positive: [tests/t1.py], negative: []}
+"""
+
+EXPLICIT_TAGS = """\
+claims:
+- id: !!str 42
+  extra: !!int "12"
+  implementation: {file: !!str qsp/minicore.py}
+"""
+
+VALID_DOCS = [PLAIN, ANCHORS, MERGE, EXPLICIT_TAGS, "claims: []\n", "claims: not-a-list\n"]
+
+INVALID_DOCS = [
+    # multiple documents
+    "claims: []\n---\nclaims: []\n",
+    # bad tags / values in fields the checks never read
+    'claims:\n- id: A1\n  junk: !!int "abc"\n',
+    "claims:\n- id: A1\n  junk: !!python/name:os.system\n",
+    "claims: []\nmeta: !!python/object/apply:os.getcwd []\n",
+    "claims:\n- id: A1\n  notes: {when: 2001-13-45}\n",
+    "claims: []\nmeta: [*undefined]\n",
+    "claims:\n- id: A1\n  junk: !custom x\n",
+    # complex (unhashable) keys: top level, directly in a claim, in a read field
+    "claims: []\n? [a, b]\n: 1\n",
+    "claims:\n- id: A1\n  {a: 1}: 2\n",
+    "claims:\n- id: A1\n  tests: {[a]: 1}\n",
+    # bad values in read fields
+    'claims:\n- id: !!float "x"\n',
+    # non-mapping root / empty document
+    "- claims\n",
+    "",
+]
+
+
+def _reduced(data):
+    """Only what the checks read: top-level 'claims' and the claim fields."""
+    assert isinstance(data, dict)
+    claims = data.get("claims")
+    if isinstance(claims, list):
+        claims = [
+            {k: v for k, v in c.items() if k in cci._CLAIM_FIELDS} if isinstance(c, dict) else c
+            for c in claims
+        ]
+    return {"claims": claims} if "claims" in data else {}
+
+
+def _expected(text):
+    return _reduced(yaml.safe_load(text))
+
+
+@pytest.mark.parametrize("text", VALID_DOCS)
+def test_read_yaml_matches_safe_load(tmp_path, text):
+    p = tmp_path / "claims.yml"
+    p.write_text(text)
+    assert _reduced(cci._read_yaml(p)) == _expected(text)
+
+
+@pytest.mark.parametrize("text", INVALID_DOCS)
+def test_read_yaml_rejects_what_safe_load_rejects(tmp_path, text):
+    p = tmp_path / "claims.yml"
+    p.write_text(text)
+    with pytest.raises(Exception):
+        _expected(text)
+    with pytest.raises(RuntimeError, match="Failed to parse YAML"):
+        cci._read_yaml(p)
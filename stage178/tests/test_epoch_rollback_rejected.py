@@ -22,3 +22,12 @@ def test_epoch_skip_rejected():
     # skip attempt (1 -> 3) must fail
     with pytest.raises(EpochViolation):
         s.set_epoch(3)
+
+
+@pytest.mark.parametrize("bad", ["1", None, b"\x01"])
+def test_non_integer_epoch_rejected(bad):
+    s = SessionState()
+
+    # malformed epoch must fail closed with EpochViolation, not a TypeError
+    with pytest.raises(EpochViolation):
+        s.set_epoch(bad)
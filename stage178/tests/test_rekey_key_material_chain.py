@@ -0,0 +1,16 @@
+# MIT License © 2025 Motohiro Suzuki
+import hashlib
+
+from qsp.minicore import MiniCore
+
+
+def test_rekey_key_material_chain():
+    c = MiniCore()
+    c.accept_frame({"type": "HANDSHAKE_DONE", "session_id": 42, "epoch": 1, "payload": b""})
+    k1 = c.s.key_material
+
+    r = c.accept_frame({"type": "REKEY", "session_id": 42, "epoch": 2, "payload": b"rk"})
+
+    expected = hashlib.sha256(k1 + b"rekey" + (2).to_bytes(8, "big", signed=True) + b"rk").digest()
+    assert c.s.key_material == expected
+    assert r.key_fingerprint_hex == hashlib.sha256(expected).hexdigest()
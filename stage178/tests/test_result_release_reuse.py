@@ -0,0 +1,38 @@
+# MIT License © 2025 Motohiro Suzuki
+from qsp.minicore import MiniCore, release_result
+
+
+def test_released_result_is_reused_with_fresh_fields():
+    c = MiniCore()
+    r1 = c.accept_frame({"type": "HANDSHAKE_DONE", "session_id": 31, "epoch": 1, "payload": b""})
+    fp = r1.key_fingerprint_hex
+    release_result(r1)
+
+    r2 = c.accept_frame({"type": "APP_DATA", "session_id": 31, "epoch": 1, "payload": b"x"})
+    assert r2 is r1
+    assert r2.ok is True
+    assert r2.detail == "app"
+    assert r2.epoch == 1
+    assert r2.session_id == 31
+    assert r2.key_fingerprint_hex == fp
+
+
+def test_unreleased_results_are_distinct():
+    c = MiniCore()
+    r1 = c.accept_frame({"type": "HANDSHAKE_DONE", "session_id": 32, "epoch": 1, "payload": b""})
+    r2 = c.accept_frame({"type": "APP_DATA", "session_id": 32, "epoch": 1, "payload": b"x"})
+    assert r1 is not r2
+    assert r1.detail == "handshake"
+
+
+def test_double_release_does_not_alias_results():
+    c = MiniCore()
+    r1 = c.accept_frame({"type": "HANDSHAKE_DONE", "session_id": 33, "epoch": 1, "payload": b""})
+    release_result(r1)
+    release_result(r1)
+
+    r2 = c.accept_frame({"type": "APP_DATA", "session_id": 33, "epoch": 1, "payload": b"x"})
+    r3 = c.accept_frame({"type": "REKEY", "session_id": 33, "epoch": 2, "payload": b""})
+    assert r2 is not r3
+    assert r2.detail == "app"
+    assert r3.detail == "rekey"
@@ -10,6 +10,14 @@ Purpose:
   - all tests.positive / tests.negative files exist
 - (Optional) Validate that formal_model.lemma name appears in the model file text
   - This is a lightweight check (string search), not a proof run.
+  - Each model file is scanned once for all of its lemmas
+    (Aho-Corasick if the optional 'pyahocorasick' package is installed).
+
+Caching:
+- A passing run is recorded in <root>/.cache/claims_integrity.json, keyed by the
+  claims.yml bytes, the options and this script, plus mtime/size of every
+  referenced artifact. An unchanged re-run skips all checks (--no-cache to force).
+- Failures are never cached.
 
 Exit code:
 - 0 if all checks pass
@@ -19,14 +27,26 @@ Usage:
   python tools/check_claims_integrity.py
   python tools/check_claims_integrity.py --strict-lemma
   python tools/check_claims_integrity.py --root /path/to/stage178
+  python tools/check_claims_integrity.py --stat-workers 32   # slow / network filesystems
+  python tools/check_claims_integrity.py --strict-lemma --jobs 4
+  python tools/check_claims_integrity.py --no-cache
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import mmap
+import os
+import stat
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 try:
     import yaml  # type: ignore
@@ -34,11 +54,177 @@ except Exception as e:
     print("[FATAL] PyYAML is not installed. Install it via: python -m pip install pyyaml")
     raise
 
+try:
+    import ahocorasick  # type: ignore  # optional: pyahocorasick, multi-lemma search
+except Exception:
+    ahocorasick = None
+
+# libyaml C loader when PyYAML was built with it (same safe semantics, much faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Only these fields of a claim are read by the checks. Everything else (title,
+# claim text, assumptions, ...) is validated on the fly but never built into
+# Python objects, which is where most of the load time goes.
+_CLAIM_FIELDS = frozenset(("id", "formal_model", "implementation", "tests"))
+_STR_TAG = "tag:yaml.org,2002:str"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+class _NeedNodes(Exception):
+    """Event fast path can't handle this document (alias, merge key, explicit tag, ...)."""
+
+
+def _event_scalar_tag(loader: Any, ev: Any) -> str:
+    # only implicitly tagged scalars are handled here; explicit tags go through
+    # the full loader so they are accepted / rejected exactly as by safe_load
+    if ev.tag not in (None, "!"):
+        raise _NeedNodes
+    tag = loader.resolve(yaml.ScalarNode, ev.value, ev.implicit)
+    if tag == _MERGE_TAG:
+        raise _NeedNodes
+    return tag
+
+
+def _event_require_scalar_key(loader: Any) -> None:
+    # complex (sequence / mapping) keys: safe_load rejects them as unhashable;
+    # leave that to the full loader so the error is the same
+    if not loader.check_event(yaml.ScalarEvent):
+        raise _NeedNodes
+
+
+def _event_value(loader: Any) -> Any:
+    """Build the next value straight from parser events (plain YAML only)."""
+    ev = loader.get_event()
+    if isinstance(ev, yaml.ScalarEvent):
+        tag = _event_scalar_tag(loader, ev)
+        return loader.construct_object(yaml.ScalarNode(tag, ev.value, style=ev.style))
+    if isinstance(ev, yaml.SequenceStartEvent):
+        if ev.tag not in (None, "!"):
+            raise _NeedNodes
+        out: List[Any] = []
+        while not loader.check_event(yaml.SequenceEndEvent):
+            out.append(_event_value(loader))
+        loader.get_event()
+        return out
+    if isinstance(ev, yaml.MappingStartEvent):
+        if ev.tag not in (None, "!"):
+            raise _NeedNodes
+        d: Dict[Any, Any] = {}
+        while not loader.check_event(yaml.MappingEndEvent):
+            _event_require_scalar_key(loader)
+            k = _event_value(loader)
+            d[k] = _event_value(loader)
+        loader.get_event()
+        return d
+    raise _NeedNodes  # alias
+
+
+def _event_skip(loader: Any) -> None:
+    """
+    Consume the next value without building it, failing wherever safe_load would.
+    Plain strings (the bulk of any skipped text) cost nothing; other implicit
+    scalars (int, bool, timestamp, ...) are constructed so invalid ones still
+    raise; anything needing the node graph falls back to the full loader.
+    """
+    ev = loader.get_event()
+    if isinstance(ev, yaml.ScalarEvent):
+        tag = _event_scalar_tag(loader, ev)
+        if tag != _STR_TAG:
+            loader.construct_object(yaml.ScalarNode(tag, ev.value, style=ev.style))
+        return
+    if isinstance(ev, yaml.SequenceStartEvent):
+        if ev.tag not in (None, "!"):
+            raise _NeedNodes
+        while not loader.check_event(yaml.SequenceEndEvent):
+            _event_skip(loader)
+        loader.get_event()
+        return
+    if isinstance(ev, yaml.MappingStartEvent):
+        if ev.tag not in (None, "!"):
+            raise _NeedNodes
+        while not loader.check_event(yaml.MappingEndEvent):
+            _event_require_scalar_key(loader)
+            _event_skip(loader)
+            _event_skip(loader)
+        loader.get_event()
+        return
+    raise _NeedNodes  # alias (may be undefined; the composer checks that)
+
+
+def _event_pruned_mapping(loader: Any, wanted: FrozenSet[str]) -> Dict[Any, Any]:
+    """Body of a mapping (start event already consumed), keeping only `wanted` keys."""
+    d: Dict[Any, Any] = {}
+    while not loader.check_event(yaml.MappingEndEvent):
+        _event_require_scalar_key(loader)
+        k = _event_value(loader)
+        if isinstance(k, str) and k in wanted:
+            d[k] = _event_value(loader)
+        else:
+            _event_skip(loader)
+    loader.get_event()
+    return d
+
+
+def _events_claims_doc(loader: Any) -> Any:
+    """
+    Same result as safe_load for everything main() reads ({"claims": [...]}),
+    for plain single-document YAML. Raises _NeedNodes otherwise.
+    """
+    loader.get_event()  # StreamStart
+    if loader.check_event(yaml.StreamEndEvent):
+        return None
+    loader.get_event()  # DocumentStart
+    if not loader.check_event(yaml.MappingStartEvent):
+        data = _event_value(loader)
+    else:
+        if loader.get_event().tag not in (None, "!"):
+            raise _NeedNodes
+        data = {}
+        while not loader.check_event(yaml.MappingEndEvent):
+            _event_require_scalar_key(loader)
+            k = _event_value(loader)
+            if k != "claims":
+                _event_skip(loader)
+            elif loader.check_event(yaml.SequenceStartEvent):
+                if loader.get_event().tag not in (None, "!"):
+                    raise _NeedNodes
+                claims: List[Any] = []
+                while not loader.check_event(yaml.SequenceEndEvent):
+                    if loader.check_event(yaml.MappingStartEvent):
+                        if loader.get_event().tag not in (None, "!"):
+                            raise _NeedNodes
+                        claims.append(_event_pruned_mapping(loader, _CLAIM_FIELDS))
+                    else:
+                        claims.append(_event_value(loader))
+                loader.get_event()
+                data["claims"] = claims
+            else:
+                data["claims"] = _event_value(loader)
+        loader.get_event()
+    loader.get_event()  # DocumentEnd
+    if not loader.check_event(yaml.StreamEndEvent):
+        raise _NeedNodes  # multiple documents: let the full loader report it
+    return data
+
 
 def _read_yaml(path: Path) -> Dict[str, Any]:
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        # bytes in: the parser detects the encoding itself, no Python-side decode.
+        # Fast path walks parser events and only builds the claim fields main()
+        # reads; documents using anchors/aliases, merge keys, explicit tags or
+        # complex keys are re-read with the full safe loader (i.e. safe_load).
+        with path.open("rb") as f:
+            loader = _YAML_LOADER(f)
+            try:
+                data = _events_claims_doc(loader)
+            except _NeedNodes:
+                f.seek(0)
+                loader.dispose()
+                loader = _YAML_LOADER(f)
+                data = loader.get_single_data()
+            finally:
+                loader.dispose()
         if not isinstance(data, dict):
             raise ValueError("claims.yml root must be a YAML mapping (dict).")
         return data
@@ -50,34 +236,307 @@ def _as_list(v: Any) -> List[str]:
     if v is None:
         return []
     if isinstance(v, list):
-        out: List[str] = []
+        # common case: already a list of str -> hand it back (read-only use).
+        # Every element is checked; a non-str one past a sample would reach path joins
         for x in v:
-            if isinstance(x, str):
-                out.append(x)
-            else:
-                out.append(str(x))
-        return out
+            if type(x) is not str:
+                break
+        else:
+            return v
+        return [x if isinstance(x, str) else str(x) for x in v]
     if isinstance(v, str):
         return [v]
     return [str(v)]
 
 
-def _check_file_exists(root: Path, rel_path: str) -> Tuple[bool, str]:
+def _full_path(root: str, rel_path: str) -> str:
     # allow absolute paths, but prefer relative
-    p = Path(rel_path)
-    full = p if p.is_absolute() else (root / p)
-    if full.exists() and full.is_file():
-        return True, str(full)
-    return False, str(full)
+    # (plain string join: no Path objects on the per-artifact path)
+    return rel_path if os.path.isabs(rel_path) else os.path.join(root, rel_path)
+
+
+def _check_file_exists(root: str, rel_path: str) -> Tuple[bool, str]:
+    # not memoized: _check_files_exist already checks each unique path once per
+    # run, and a process-wide memo would outlive the run (stale after a delete)
+    full = _full_path(root, rel_path)
+    # one stat() syscall instead of exists() + is_file()
+    try:
+        ok = stat.S_ISREG(os.stat(full).st_mode)
+    except (OSError, ValueError):
+        ok = False
+    return ok, full
 
 
-def _find_lemma_in_model(model_file: Path, lemma_name: str) -> bool:
-    # lightweight string presence check
+def _list_regular_files(directory: str, wanted: Set[str]) -> Optional[FrozenSet[str]]:
+    """Which of `wanted` are regular files (symlinks followed) in one directory, or None if it can't be listed."""
+    # is_file() is answered from the cached d_type for plain entries, but costs a
+    # stat() for symlinks and on filesystems without d_type: only ask for the
+    # names that are actually referenced
     try:
-        text = model_file.read_text(encoding="utf-8", errors="replace")
+        with os.scandir(directory) as it:
+            return frozenset(e.name for e in it if e.name in wanted and e.is_file())
+    except (OSError, ValueError):  # ValueError: embedded NUL in the path
+        return None
+
+
+def _check_files_exist(root_str: str, rel_paths: Iterable[str], workers: int) -> Dict[str, Tuple[bool, str]]:
+    """
+    Existence check for every unique path, with the same results as _check_file_exists.
+
+    Paths are grouped by parent directory: a directory holding several referenced
+    files is listed once with scandir() and answered from that listing; a path
+    alone in its directory (or in one that can't be listed) gets a plain stat().
+    Names missing from a listing are re-checked with stat() too: the listing
+    matches names exactly, while stat() follows the filesystem's own rules
+    (case-insensitive on macOS / Windows), so results never depend on how the
+    paths happen to be grouped.
+    Directories are processed in a thread pool since these syscalls release the
+    GIL, which hides latency on cold caches / network filesystems.
+    """
+    by_dir: Dict[str, List[Tuple[str, str, str]]] = {}
+    for rel in dict.fromkeys(rel_paths):
+        full = _full_path(root_str, rel)
+        directory, name = os.path.split(full)
+        by_dir.setdefault(directory, []).append((rel, name, full))
+
+    def check_dir(item: Tuple[str, List[Tuple[str, str, str]]]) -> List[Tuple[str, Tuple[bool, str]]]:
+        directory, entries = item
+        names = _list_regular_files(directory, {name for _, name, _ in entries}) if len(entries) > 1 else None
+        if names is None:
+            return [(rel, _check_file_exists(root_str, rel)) for rel, _, _ in entries]
+        return [
+            (rel, (True, full) if name in names else _check_file_exists(root_str, rel))
+            for rel, name, full in entries
+        ]
+
+    groups = list(by_dir.items())
+    if workers <= 1 or len(groups) <= 1:
+        per_dir = map(check_dir, groups)
+        return {rel: res for results in per_dir for rel, res in results}
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return {rel: res for results in ex.map(check_dir, groups) for rel, res in results}
+
+
+# model files up to this size are read into memory; larger files are
+# memory-mapped instead of copied onto the heap
+_MODEL_READ_MAX_BYTES = 4 * 1024 * 1024
+
+
+# large files are searched window by window through the mapping
+_MMAP_WINDOW = 1024 * 1024
+
+
+def _lemma_automaton(lemmas: Set[str]) -> Any:
+    automaton = ahocorasick.Automaton()
+    for l in lemmas:
+        automaton.add_word(l, l)
+    automaton.make_automaton()
+    return automaton
+
+
+def _mmap_find_lemmas(model_file: str, lemmas: Set[str]) -> Set[str]:
+    # large file: a single pass over a read-only mapping for all lemmas, window
+    # by window (no read() copies of the file; pages come from the page cache).
+    # Windows overlap by the longest needle minus one so a match can straddle
+    # two windows; the pass stops as soon as every lemma was seen.
+    pending = {l: l.encode("utf-8") for l in lemmas}
+    found: Set[str] = set()
+    overlap = max((len(n) for n in pending.values()), default=1) - 1
+    automaton = _lemma_automaton(lemmas) if ahocorasick is not None and len(lemmas) > 1 else None
+    try:
+        with open(model_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            for start in range(0, size, _MMAP_WINDOW):
+                end = min(start + _MMAP_WINDOW + overlap, size)
+                if automaton is not None:
+                    # one automaton scan per window (decodes only this window)
+                    for _, l in automaton.iter(mm[start:end].decode("utf-8", errors="replace")):
+                        found.add(l)
+                    if len(found) == len(lemmas):
+                        break
+                    continue
+                for l, n in list(pending.items()):
+                    if mm.find(n, start, end) != -1:
+                        found.add(l)
+                        del pending[l]
+                if not pending:
+                    break
     except Exception:
-        return False
-    return lemma_name in text
+        pass
+    return found
+
+
+def _find_lemmas_in_model(model_file: str, lemmas: Set[str]) -> Set[str]:
+    """
+    Which of `lemmas` appear in one model file, scanning it once for all of them.
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, else one
+    substring search per lemma over the file's bytes.
+
+    Lemmas are grouped per file by the caller, so each file is read exactly
+    once per run and nothing is cached across calls.
+    """
+    try:
+        with open(model_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size > _MODEL_READ_MAX_BYTES:
+                text = None
+            else:
+                text = f.read()
+    except OSError:
+        return set()
+    if text is None:
+        return _mmap_find_lemmas(model_file, lemmas)
+    if ahocorasick is not None and len(lemmas) > 1:
+        automaton = _lemma_automaton(lemmas)
+        found: Set[str] = set()
+        for _, l in automaton.iter(text.decode("utf-8", errors="replace")):
+            found.add(l)
+            if len(found) == len(lemmas):
+                break
+        return found
+    return {l for l in lemmas if l.encode("utf-8") in text}
+
+
+@dataclass
+class _ClaimColumns:
+    """claims.yml rows as parallel columns (index i = claim i)."""
+    invalid: List[Optional[str]] = field(default_factory=list)  # row-level failure, else None
+    ids: List[str] = field(default_factory=list)
+    fm_is_map: List[bool] = field(default_factory=list)
+    fm_files: List[str] = field(default_factory=list)
+    fm_lemmas: List[str] = field(default_factory=list)
+    impl_is_map: List[bool] = field(default_factory=list)
+    impl_files: List[str] = field(default_factory=list)
+    tests_is_map: List[bool] = field(default_factory=list)
+    pos: List[List[str]] = field(default_factory=list)
+    neg: List[List[str]] = field(default_factory=list)
+
+
+# shared stand-in for an absent section (never mutated); a missing section is
+# valid, an explicit non-mapping value is not
+_NO_SECTION: Dict[str, Any] = {}
+
+
+def _claim_columns(claims: List[Any]) -> _ClaimColumns:
+    """One pass over the claims extracting every field the checks need."""
+    cols = _ClaimColumns()
+    for i, c in enumerate(claims):
+        invalid: Optional[str] = None
+        cid = ""
+        if not isinstance(c, dict):
+            invalid = f"Claim index {i}: must be a mapping"
+        else:
+            cid = str(c.get("id", "")).strip()
+            if not cid:
+                invalid = f"Claim index {i}: missing 'id'"
+        if invalid is not None:
+            c = _NO_SECTION  # no further checks for this row; keep columns aligned
+
+        fm = c.get("formal_model", _NO_SECTION)
+        impl = c.get("implementation", _NO_SECTION)
+        tests = c.get("tests", _NO_SECTION)
+        fm_is_map = isinstance(fm, dict)
+        impl_is_map = isinstance(impl, dict)
+        tests_is_map = isinstance(tests, dict)
+        if not fm_is_map:
+            fm = _NO_SECTION
+        if not impl_is_map:
+            impl = _NO_SECTION
+        if not tests_is_map:
+            tests = _NO_SECTION
+
+        # str() on a value that already is a str returns it unchanged from C; it is
+        # cheaper than an isinstance() guard or a helper call, so it stays inline
+        cols.invalid.append(invalid)
+        cols.ids.append(cid)
+        cols.fm_is_map.append(fm_is_map)
+        cols.fm_files.append(str(fm.get("file", "")).strip())
+        cols.fm_lemmas.append(str(fm.get("lemma", "")).strip())
+        cols.impl_is_map.append(impl_is_map)
+        cols.impl_files.append(str(impl.get("file", "")).strip())
+        cols.tests_is_map.append(tests_is_map)
+        cols.pos.append(_as_list(tests.get("positive")))
+        cols.neg.append(_as_list(tests.get("negative")))
+    return cols
+
+
+# --jobs auto: only worth the process start-up cost for large claim sets
+_AUTO_JOBS_MIN_CLAIMS = 200
+
+
+def _lemma_hits(by_model: Dict[str, Set[str]], jobs: int) -> Dict[str, Set[str]]:
+    """Scan each model file for its lemmas; files are independent, so they can run in worker processes."""
+    if jobs <= 1 or len(by_model) <= 1:
+        return {resolved: _find_lemmas_in_model(resolved, lemmas) for resolved, lemmas in by_model.items()}
+    files = list(by_model)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as ex:
+        return dict(zip(files, ex.map(_find_lemmas_in_model, files, (by_model[f] for f in files))))
+
+
+def _write_report(warnings: List[str], failures: List[str], ok_line: str = "") -> None:
+    """The whole report in one stdout write instead of a print() per line."""
+    lines: List[str] = []
+    if warnings:
+        lines.append("[WARN] non-fatal issues:")
+        lines.extend([f"  - {w}" for w in warnings])
+    if failures:
+        lines.append("[FAIL] integrity check failed:")
+        lines.extend([f"  - {f}" for f in failures])
+    elif ok_line:
+        lines.append(ok_line)
+    if lines:
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+
+
+_CACHE_REL = os.path.join(".cache", "claims_integrity.json")
+
+
+def _cache_key(claims_bytes: bytes, claims_path: str, strict_lemma: bool) -> str:
+    """Everything that decides the verdict apart from the artifacts themselves."""
+    h = hashlib.blake2b(claims_bytes, digest_size=16)
+    try:
+        st = os.stat(__file__)
+        h.update(f"\0{st.st_mtime_ns}:{st.st_size}".encode())
+    except OSError:
+        pass
+    h.update(f"\0{claims_path}\0{int(strict_lemma)}".encode())
+    return h.hexdigest()
+
+
+def _artifact_stamp(root: str, rel_paths: Iterable[str]) -> Optional[str]:
+    """Digest of (path, mtime_ns, size) for every artifact; None if any is gone."""
+    h = hashlib.blake2b(digest_size=16)
+    for rel in rel_paths:
+        try:
+            st = os.stat(_full_path(root, rel))
+        except (OSError, ValueError, TypeError):  # TypeError: malformed cache entry
+            return None
+        h.update(f"{rel}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return h.hexdigest()
+
+
+def _load_cache(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "rb") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_cache(path: str, data: Dict[str, Any]) -> None:
+    # best effort: a read-only checkout must not turn a pass into a failure
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
 
 
 def main() -> int:
@@ -89,15 +548,65 @@ def main() -> int:
         action="store_true",
         help="also require that formal_model.lemma name appears in model file text",
     )
+    ap.add_argument(
+        "--stat-workers",
+        type=int,
+        default=8,
+        help="threads used for artifact existence checks (default: 8; 1 = serial)",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "worker processes for --strict-lemma model scans (one model file per task); "
+            f"default: one per CPU above {_AUTO_JOBS_MIN_CLAIMS} claims, else 1"
+        ),
+    )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"always run every check; neither read nor update <root>/{_CACHE_REL}",
+    )
     args = ap.parse_args()
 
     root = Path(args.root).resolve()
     claims_path = (root / args.claims).resolve()
+    # resolved once; everything downstream joins and opens plain strings
+    root_str = str(root)
 
     if not claims_path.exists():
         print(f"[FAIL] claims file not found: {claims_path}")
         return 2
 
+    # cached pass: same claims.yml / options / script and untouched artifacts
+    use_cache = not args.no_cache
+    if use_cache:
+        cache_path = os.path.join(root_str, _CACHE_REL)
+        cache = _load_cache(cache_path)
+        try:
+            key = _cache_key(claims_path.read_bytes(), str(claims_path), args.strict_lemma)
+        except OSError:
+            use_cache = False
+        else:
+            hit = cache.get(str(claims_path))
+            # anything malformed in the entry is a miss, never part of the output
+            if (
+                isinstance(hit, dict)
+                and hit.get("key") == key
+                and type(hit.get("claims")) is int
+                and isinstance(hit.get("warnings"), list)
+                and all(isinstance(w, str) for w in hit["warnings"])
+                and isinstance(hit.get("files"), list)
+                and hit.get("stamp") == _artifact_stamp(root_str, hit["files"])
+            ):
+                _write_report(
+                    hit["warnings"],
+                    [],
+                    f"[OK] claims integrity passed: {hit['claims']} claims checked (cached)",
+                )
+                return 0
+
     data = _read_yaml(claims_path)
 
     claims = data.get("claims")
@@ -107,41 +616,63 @@ def main() -> int:
 
     failures: List[str] = []
     warnings: List[str] = []
+    # bound appends: no extra Python frame per reported issue
+    fail = failures.append
+    warn = warnings.append
+
+    cols = _claim_columns(claims)
+
+    # every referenced artifact in one flat batch (parallel stat / scandir);
+    # results come back keyed by path and are looked up per claim below
+    file_checks = _check_files_exist(
+        root_str,
+        chain(
+            (f for f in cols.fm_files if f),
+            (f for f in cols.impl_files if f),
+            chain.from_iterable(cols.pos),
+            chain.from_iterable(cols.neg),
+        ),
+        args.stat_workers,
+    )
 
-    def fail(msg: str) -> None:
-        failures.append(msg)
-
-    def warn(msg: str) -> None:
-        warnings.append(msg)
-
-    seen_ids: set[str] = set()
-
-    for i, c in enumerate(claims):
-        if not isinstance(c, dict):
-            fail(f"Claim index {i}: must be a mapping")
+    # strict-lemma: one pass per model file for all of its lemmas
+    lemma_hits: Dict[str, Set[str]] = {}
+    if args.strict_lemma:
+        by_model: Dict[str, Set[str]] = {}
+        for fm_file, fm_lemma in zip(cols.fm_files, cols.fm_lemmas):
+            if fm_file and fm_lemma:
+                ok, resolved = file_checks[fm_file]
+                if ok:
+                    by_model.setdefault(resolved, set()).add(fm_lemma)
+        jobs = args.jobs
+        if jobs is None:
+            jobs = (os.cpu_count() or 1) if len(claims) > _AUTO_JOBS_MIN_CLAIMS else 1
+        lemma_hits = _lemma_hits(by_model, jobs)
+
+    # duplicate ids: every occurrence after the first is reported
+    id_counts = Counter(cid for cid, bad in zip(cols.ids, cols.invalid) if bad is None)
+    first_index: Dict[str, int] = {}
+
+    for i, invalid in enumerate(cols.invalid):
+        if invalid is not None:
+            fail(invalid)
             continue
 
-        cid = str(c.get("id", "")).strip()
-        if not cid:
-            fail(f"Claim index {i}: missing 'id'")
-            continue
-        if cid in seen_ids:
+        cid = cols.ids[i]
+        if id_counts[cid] > 1 and first_index.setdefault(cid, i) != i:
             fail(f"Claim {cid}: duplicate id")
-        seen_ids.add(cid)
 
         # formal model file + lemma
-        fm = c.get("formal_model", {})
-        if not isinstance(fm, dict):
+        if not cols.fm_is_map[i]:
             fail(f"Claim {cid}: formal_model must be a mapping")
-            fm = {}
 
-        fm_file = str(fm.get("file", "")).strip()
-        fm_lemma = str(fm.get("lemma", "")).strip()
+        fm_file = cols.fm_files[i]
+        fm_lemma = cols.fm_lemmas[i]
 
         if not fm_file:
             fail(f"Claim {cid}: formal_model.file is missing")
         else:
-            ok, resolved = _check_file_exists(root, fm_file)
+            ok, resolved = file_checks[fm_file]
             if not ok:
                 fail(f"Claim {cid}: formal_model.file not found: {fm_file} -> {resolved}")
             else:
@@ -149,7 +680,7 @@ def main() -> int:
                     if not fm_lemma:
                         fail(f"Claim {cid}: formal_model.lemma is missing (strict-lemma enabled)")
                     else:
-                        if not _find_lemma_in_model(Path(resolved), fm_lemma):
+                        if fm_lemma not in lemma_hits.get(resolved, ()):
                             fail(
                                 f"Claim {cid}: lemma name not found in model file text: "
                                 f"{fm_lemma} (file: {fm_file})"
@@ -159,27 +690,23 @@ def main() -> int:
                         warn(f"Claim {cid}: formal_model.lemma is empty (non-strict mode)")
 
         # implementation anchor file
-        impl = c.get("implementation", {})
-        if not isinstance(impl, dict):
+        if not cols.impl_is_map[i]:
             fail(f"Claim {cid}: implementation must be a mapping")
-            impl = {}
 
-        impl_file = str(impl.get("file", "")).strip()
+        impl_file = cols.impl_files[i]
         if not impl_file:
             fail(f"Claim {cid}: implementation.file is missing")
         else:
-            ok, resolved = _check_file_exists(root, impl_file)
+            ok, resolved = file_checks[impl_file]
             if not ok:
                 fail(f"Claim {cid}: implementation.file not found: {impl_file} -> {resolved}")
 
         # tests
-        tests = c.get("tests", {})
-        if not isinstance(tests, dict):
+        if not cols.tests_is_map[i]:
             fail(f"Claim {cid}: tests must be a mapping")
-            tests = {}
 
-        pos = _as_list(tests.get("positive"))
-        neg = _as_list(tests.get("negative"))
+        pos = cols.pos[i]
+        neg = cols.neg[i]
 
         if not pos:
             warn(f"Claim {cid}: tests.positive is empty")
@@ -187,27 +714,33 @@ def main() -> int:
             fail(f"Claim {cid}: tests.negative MUST NOT be empty (Stage178-A requirement)")
 
         for p in pos:
-            ok, resolved = _check_file_exists(root, p)
+            ok, resolved = file_checks[p]
             if not ok:
                 fail(f"Claim {cid}: tests.positive missing: {p} -> {resolved}")
 
         for p in neg:
-            ok, resolved = _check_file_exists(root, p)
+            ok, resolved = file_checks[p]
             if not ok:
                 fail(f"Claim {cid}: tests.negative missing: {p} -> {resolved}")
 
-    if warnings:
-        print("[WARN] non-fatal issues:")
-        for w in warnings:
-            print(f"  - {w}")
-
     if failures:
-        print("[FAIL] integrity check failed:")
-        for f in failures:
-            print(f"  - {f}")
+        _write_report(warnings, failures)
         return 2
 
-    print(f"[OK] claims integrity passed: {len(claims)} claims checked")
+    if use_cache:
+        files = sorted(file_checks)
+        stamp = _artifact_stamp(root_str, files)
+        if stamp is not None:
+            cache[str(claims_path)] = {
+                "key": key,
+                "files": files,
+                "stamp": stamp,
+                "claims": len(claims),
+                "warnings": warnings,
+            }
+            _store_cache(cache_path, cache)
+
+    _write_report(warnings, failures, f"[OK] claims integrity passed: {len(claims)} claims checked")
     return 0
 
 